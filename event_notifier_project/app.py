@@ -1,9 +1,24 @@
 import os
-from datetime import datetime
-from flask import Flask, render_template, request, redirect, url_for, abort
+import time
+import threading
+import hashlib
+from datetime import date
+from flask import Flask, render_template, request, redirect, url_for, abort, make_response, jsonify
 from flask_sqlalchemy import SQLAlchemy
+from werkzeug.exceptions import BadRequest
+from sqlalchemy import event as sa_event, inspect as sa_inspect, text, bindparam
+from sqlalchemy.exc import DatabaseError, SQLAlchemyError
 import json     # JSON 데이터 처리를 위해 json 모듈 사용
-import traceback # 오류 추적을 위해 import
+
+try:
+    import ijson  # (선택) 대용량 JSON을 한 레코드씩 스트리밍 파싱
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # (선택) ijson이 없을 때 표준 json보다 빠르게 파일 전체를 파싱
+except ImportError:
+    orjson = None
 
 # --- 1. Flask 앱 초기 설정 및 DB 경로 설정 ---
 app = Flask(__name__)
@@ -16,16 +31,35 @@ app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 # SQLAlchemy 객체 초기화
 db = SQLAlchemy()
 
+# 새 SQLite 연결마다 적용할 PRAGMA 설정
+# WAL: 쓰기 중에도 읽기가 막히지 않음 / synchronous=NORMAL: WAL에서는 커밋마다 fsync 하지 않아도 안전
+SQLITE_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',  # 256MB
+    'PRAGMA cache_size=-65536',    # 64MB
+)
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
 # 명시적으로 Flask 앱에 DB 설정 연결 (오류 방지)
 with app.app_context():
     db.init_app(app)
+    sa_event.listen(db.engine, 'connect', set_sqlite_pragmas)
 
 # --- 2. 데이터베이스 모델 정의 ---
 class Category(db.Model):
     __tablename__ = 'category'
     category_id = db.Column(db.Integer, primary_key=True)
     category_name = db.Column(db.String(50), unique=True, nullable=False)
-    events = db.relationship('Event', backref='category', lazy=True)
+    # 상세 페이지에서 event.category를 바로 쓰므로 Event 조회 시 category를 JOIN으로 함께 로딩
+    # (목록 페이지는 컬럼만 조회하고 캐시된 카테고리 이름을 사용하므로 관계를 거치지 않음)
+    events = db.relationship('Event', backref=db.backref('category', lazy='joined'), lazy=True)
     def __repr__(self):
         return f'<Category {self.category_name}>'
 
@@ -38,109 +72,285 @@ class Event(db.Model):
     start_date = db.Column(db.Date, nullable=False)
     end_date = db.Column(db.Date, nullable=False)
     category_id = db.Column(db.Integer, db.ForeignKey('category.category_id'), nullable=False)
+    # 목록 페이지 쿼리(end_date >= 오늘 ORDER BY start_date)용 복합 인덱스
+    # 카테고리별 목록 조회(category_id = ? AND end_date >= 오늘)에는 category_id로 시작하는 인덱스 사용
+    __table_args__ = (
+        db.Index('ix_event_end_start', 'end_date', 'start_date'),
+        db.Index('ix_event_cat_end_start', 'category_id', 'end_date', 'start_date'),
+    )
     def __repr__(self):
         return f'<Event {self.title}>'
 
+# --- 자주 실행되는 쿼리 ---
+# 모듈 로딩 시 한 번만 구성하여 요청마다 같은 SELECT 문을 다시 만들지 않음 (컴파일 캐시 재사용)
+CATEGORY_LIST_QUERY = db.select(Category.category_id, Category.category_name)
+
+# 목록 화면에 필요한 컬럼만 조회 (긴 description 컬럼과 ORM 객체 생성을 피함)
+# 인덱스 힌트(INDEXED BY)는 쓰지 않음: 인덱스가 없는 DB(init-db 실행 전)에서는 쿼리 자체가 실패하기 때문
+# init_db가 ANALYZE를 실행해 두고, 이후 등록/수정/삭제 후에는 optimize_db()로 통계를 갱신하므로 플래너가 ix_event_end_start를 선택함
+EVENT_LIST_QUERY = (
+    db.select(
+        Event.event_id, Event.title, Event.location,
+        Event.start_date, Event.end_date, Event.category_id
+    )
+    .where(Event.end_date >= bindparam('today'))
+    .order_by(Event.start_date.asc())
+)
+
+# --- 카테고리 캐시 ---
+# 카테고리는 초기화 이후 바뀌지 않으므로 매 요청마다 조회하지 않고 프로세스 단위로 보관
+# ORM 객체 대신 (category_id, category_name) Row를 저장하여 세션이 끝난 뒤에도 안전하게 사용
+_category_cache = None
+
+def get_categories():
+    global _category_cache
+    if _category_cache is None:
+        _category_cache = db.session.execute(CATEGORY_LIST_QUERY).all()
+    return _category_cache
+
+def get_category_map():
+    """카테고리 이름 -> ID 딕셔너리 반환"""
+    return {cat.category_name: cat.category_id for cat in get_categories()}
+
+def clear_category_cache():
+    global _category_cache
+    _category_cache = None
+
+# --- 목록 페이지 캐시 ---
+# 목록 페이지는 날짜가 바뀌거나 이벤트가 등록/수정/삭제될 때만 달라지므로 렌더링 결과를 날짜별로 보관
+# 캐시는 프로세스마다 따로 있으므로, 다른 워커 프로세스에서 변경된 내용도 60초 안에 반영되도록 짧게 유지
+EVENT_LIST_CACHE_TIMEOUT = 60  # 초
+_event_list_cache = {}  # {today: (만료 시각, html, etag)}
+# 캐시를 비울 때마다 1씩 증가: 렌더링하는 동안 다른 요청이 이벤트를 변경했으면 렌더링 결과(변경 전 데이터)를 저장하지 않음
+_event_list_cache_generation = 0
+_event_list_cache_lock = threading.Lock()  # 세대 비교와 저장/비우기가 스레드 사이에서 끼어들지 않도록 보호
+
+def clear_event_list_cache():
+    global _event_list_cache_generation
+    with _event_list_cache_lock:
+        _event_list_cache_generation += 1
+        _event_list_cache.clear()
+
 # --- 3. 범용 데이터 로딩 함수 (키 매핑 추가) ---
-# data_list: 실제 이벤트 데이터 목록 (JSON records)
-# cat_id: 삽입할 카테고리 ID (int)
+# 한 번에 INSERT할 레코드 수 (메모리에는 이 개수만큼만 보관, 커밋은 init_db에서 한 번)
+SEED_BATCH_SIZE = 10000
+
+def insert_event_rows(rows):
+    """모아 둔 이벤트 dict 목록을 한 번의 executemany INSERT로 저장"""
+    # ORM을 거치지 않는 Core Table INSERT (ORM bulk insert보다 오버헤드가 적음)
+    db.session.execute(Event.__table__.insert(), rows)
+
+def parse_iso_date(value):
+    """'YYYY-MM-DD' 문자열을 date로 변환, 형식이 맞지 않으면 None 반환"""
+    # date.fromisoformat은 C로 구현된 ISO 전용 파서라 strptime이나 문자열 슬라이싱보다 빠름
+    # Python 3.11부터는 '20251014', '2025-W42-2' 같은 다른 ISO 형식도 받아들이므로 길이/구분자를 먼저 확인
+    try:
+        if len(value) != 10 or value[4] != '-' or value[7] != '-':
+            return None
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+def resolve_category_id(category_map, category_name):
+    """카테고리 이름으로 ID를 찾고, 처음 보는 카테고리는 한 번만 INSERT 후 dict에 추가"""
+    cat_id = category_map.get(category_name)
+    if cat_id is None:
+        new_category = Category(category_name=category_name)
+        db.session.add(new_category)
+        db.session.flush()
+        cat_id = category_map[category_name] = new_category.category_id
+        clear_category_cache()
+    return cat_id
+
+# data_list: 실제 이벤트 데이터 목록 (JSON records, 리스트 또는 이터레이터)
+# category_map: 카테고리 이름 -> ID 딕셔너리 (get_category_map()으로 한 번만 만들어 전달)
+# default_category: 레코드에 카테고리 정보가 없을 때 사용할 카테고리 이름
 # key_map: JSON 데이터의 키 이름을 DB 필드 이름으로 매핑하는 딕셔너리
-def load_data_into_db(data_list, cat_id, key_map):
-    if not data_list:
-        print("경고: 입력된 데이터 목록이 비어있어 로딩을 건너뜜니다.")
-        return 0
+#          ('category' 키가 있으면 레코드별 카테고리 이름을 해당 JSON 키에서 읽음)
+def load_data_into_db(data_list, category_map, default_category, key_map):
+    default_cat_id = resolve_category_id(category_map, default_category)
+    # JSON 키 이름은 파일 단위로 한 번만 꺼내 두어, 반복문에서는 레코드 dict만 조회
+    title_key = key_map['title']
+    location_key = key_map['location']
+    description_key = key_map['description']
+    start_date_key = key_map['start_date']
+    end_date_key = key_map['end_date']
+    category_key = key_map.get('category')
 
     count = 0
+    rows = []
+    # 레코드마다 출력하면 잘못된 파일에서 출력 I/O가 로딩 시간을 잡아먹으므로 개수와 일부 예시만 모아 둠
+    error_count = 0
+    sample_errors = []
     for item in data_list:
         try:
             # 딕셔너리 매핑을 사용하여 데이터 추출
-            api_title = item.get(key_map['title'], '제목 없음')
-            api_location = item.get(key_map['location'], '위치 미상')
-            api_description = item.get(key_map['description'], '') 
-            start_date_raw = item.get(key_map['start_date'])
-            end_date_raw = item.get(key_map['end_date'])
+            # 키가 있어도 값이 JSON null이면 get()의 기본값이 쓰이지 않으므로 or로 대체 (NOT NULL 컬럼 보호)
+            api_title = item.get(title_key) or '제목 없음'
+            api_location = item.get(location_key) or '위치 미상'
+            api_description = item.get(description_key) or ''
+            start_date_raw = item.get(start_date_key)
+            end_date_raw = item.get(end_date_key)
 
             if not start_date_raw or not end_date_raw:
                 continue
 
-            try:
-                # 날짜 문자열을 '%Y-%m-%d' 형식으로 파싱
-                start_date = datetime.strptime(start_date_raw, '%Y-%m-%d').date()
-                end_date = datetime.strptime(end_date_raw, '%Y-%m-%d').date()
-            except Exception:
+            # 날짜 문자열을 'YYYY-MM-DD'(ISO) 형식으로 파싱
+            start_date = parse_iso_date(start_date_raw)
+            end_date = parse_iso_date(end_date_raw)
+            if start_date is None or end_date is None:
                 # 날짜 변환 오류 발생 시 건너뛰기
                 continue
 
-            new_event = Event(
-                title=api_title,
-                description=api_description,
-                location=api_location,
-                start_date=start_date,
-                end_date=end_date,
-                category_id=cat_id
-            )
-            db.session.add(new_event)
-            count += 1
+            # 레코드별 카테고리는 dict 조회 한 번으로 결정 (레코드마다 SELECT 하지 않음)
+            category_name = item.get(category_key) if category_key else None
+            cat_id = resolve_category_id(category_map, category_name) if category_name else default_cat_id
+
+            # ORM 객체 대신 dict로 모아 두었다가 한 번에 INSERT (executemany)
+            rows.append({
+                'title': api_title,
+                'description': api_description,
+                'location': api_location,
+                'start_date': start_date,
+                'end_date': end_date,
+                'category_id': cat_id
+            })
             
         except Exception as e:
-            # 특정 레코드 처리 중 오류 발생 시 메시지 출력 후 다음 레코드로 진행
-            print(f"개별 레코드 처리 중 오류 발생: {e} - 데이터: {item.get(key_map['title'])}")
-            
-    db.session.commit()
+            # 특정 레코드 처리 중 오류 발생 시 기록만 해 두고 다음 레코드로 진행
+            error_count += 1
+            if len(sample_errors) < 5:
+                sample_errors.append(f"{e} - 데이터: {item.get(title_key)}")
+            continue
+
+        # 배치 INSERT는 레코드별 try 밖에서 실행: 실패하면 특정 레코드의 오류가 아니므로 init_db까지 그대로 전달
+        if len(rows) >= SEED_BATCH_SIZE:
+            insert_event_rows(rows)
+            count += len(rows)
+            rows = []
+
+    if error_count:
+        app.logger.warning("개별 레코드 처리 중 오류 %d건 발생하여 건너뜀. 예시: %s", error_count, sample_errors)
+
+    if rows:
+        insert_event_rows(rows)
+        count += len(rows)
+    # 이터레이터는 미리 비어있는지 알 수 없으므로 다 읽은 뒤 적재된 건수로 확인
+    if count == 0:
+        print("경고: 입력된 데이터에 적재할 수 있는 레코드가 없습니다.")
+    # 커밋하지 않음: 호출하는 쪽(init_db)이 전체 초기 적재를 하나의 트랜잭션으로 커밋
     return count
 
 def load_json_file(filepath):
-    """JSON 파일을 로드하고 'records' 키의 데이터를 반환"""
+    """JSON 파일의 'records' 데이터를 한 건씩 돌려주는 이터레이터를 반환"""
+    # 상대 경로는 실행 위치가 아닌 app.py가 있는 폴더 기준으로 찾음
+    filepath = os.path.join(app.root_path, filepath)
+    # 파일이 없을 때 건너뛰면 이벤트가 없는 DB가 초기화 완료로 기록되므로 오류로 중단 (init_db가 DB 파일을 지움)
     if not os.path.exists(filepath):
-        print(f"경고: 데이터 파일 '{filepath}'을(를) 찾을 수 없어 로딩을 건너뜁니다.")
-        return None
+        raise FileNotFoundError(f"데이터 파일 '{filepath}'을(를) 찾을 수 없어 초기화를 중단합니다.")
 
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            full_data = json.load(f)
-        return full_data.get('records', [])
-    except Exception as e:
-        print(f"JSON 파일 '{filepath}' 로딩 중 심각한 오류 발생: {e}")
-        traceback.print_exc()
-        return None
+    return iter_json_records(filepath)
+
+def iter_json_records(filepath):
+    """ijson이 있으면 파일 전체를 메모리에 올리지 않고 레코드를 하나씩 파싱 (없으면 orjson, json 순으로 사용)"""
+    # 파싱 오류는 여기서 잡지 않음: 스트림 중간에서 실패하면 init_db가 적재 전체를 되돌리도록 호출한 쪽으로 전달
+    with open(filepath, 'rb') as f:
+        if ijson is not None:
+            yield from ijson.items(f, 'records.item')
+        elif orjson is not None:
+            yield from orjson.loads(f.read()).get('records', [])
+        else:
+            yield from json.load(f).get('records', [])
 
 # --- 4. 초기 DB 생성 및 데이터 설정 함수 (파일 로딩 함수 호출) ---
+# 초기화(테이블/인덱스 생성, 데이터 적재)가 끝난 DB 파일에 PRAGMA user_version으로 기록하는 값
+# 모델/인덱스/초기 데이터 구성이 바뀌면 값을 올려서 기존 DB를 새로 만들도록 함
+DB_SCHEMA_VERSION = 1
+
+def get_db_version():
+    return db.session.execute(text('PRAGMA user_version')).scalar()
+
+def remove_db_files():
+    """DB 파일과 WAL 보조 파일(-wal, -shm) 삭제 (열려 있는 연결을 먼저 모두 닫음)"""
+    db.session.close()
+    db.engine.dispose()
+    for path in (db_path, db_path + '-wal', db_path + '-shm'):
+        if os.path.exists(path):
+            os.remove(path)
+
+def has_legacy_data():
+    """user_version 기록 이전에 만든 DB인지 확인 (category/event 테이블이 있고 카테고리가 1개 이상 적재됨)"""
+    inspector = sa_inspect(db.engine)
+    if not (inspector.has_table(Category.__tablename__) and inspector.has_table(Event.__tablename__)):
+        return False
+    # 테이블만 만들어지고 적재가 중간에 끊긴 파일은 카테고리가 비어 있으므로 새로 만듦
+    return db.session.scalar(db.select(Category.category_id).limit(1)) is not None
+
+def stamp_db_version():
+    # 쿼리 플래너가 인덱스를 올바르게 선택하도록 통계 정보 갱신
+    db.session.execute(text('ANALYZE'))
+    # 초기화 완료 표시 (다음 실행부터는 위의 검사를 모두 건너뜀)
+    db.session.execute(text(f'PRAGMA user_version = {DB_SCHEMA_VERSION}'))
+    db.session.commit()
+
 def init_db():
-    db_needs_recreate = not os.path.exists(db_path) or not Category.query.first()
-
-    if os.path.exists(db_path) and not db_needs_recreate:
-        # DB 구조가 변경되었다면 삭제하고 새로 만듦 (카테고리 변경 시 강제 적용)
-        # 이전에 init_db에서 삭제 로직을 넣었으므로, 여기서는 카테고리 맵을 확인하여 진행
-        category_count = Category.query.count()
-        if category_count != 5: # 현재 기대하는 카테고리 수 (축제, 팝업, 할인, 전시, 공연)
-             os.remove(db_path)
-             db_needs_recreate = True
-             print(f"기존 DB 파일 삭제 완료. (카테고리 수 불일치: {category_count} != 5)")
-
-    if db_needs_recreate or not Event.query.first():
-        print("데이터베이스 파일을 새로 생성 및 초기화합니다.")
-        with app.app_context():
+    # DB 파일이 없으면 바로 새로 생성 (파일이 없는 상태에서 조회하면 빈 DB 파일이 먼저 만들어지므로 조회하지 않음)
+    if os.path.exists(db_path):
+        # 테이블을 조회하지 않고 PRAGMA user_version 한 번으로 DB 상태를 판단
+        try:
+            db_version = get_db_version()
+            legacy_db = db_version == 0 and has_legacy_data()
+        except DatabaseError:
+            # 손상되었거나 SQLite 형식이 아닌 파일이면 새로 만듦
+            db.session.rollback()
+            db_version = None
+            legacy_db = False
+        if db_version == DB_SCHEMA_VERSION:
+            print("기존 데이터베이스 파일을 사용합니다.")
+            return
+
+        if legacy_db:
+            # 버전 기록 이전에 만든 DB: 사용자가 등록한 이벤트가 있으므로 삭제하지 않고 인덱스만 추가
+            # (create_all()은 이미 있는 테이블의 인덱스를 만들지 않으므로 인덱스는 직접 생성, 이미 있으면 건너뜀)
             db.create_all()
+            for index in Event.__table__.indexes:
+                index.create(bind=db.engine, checkfirst=True)
+            stamp_db_version()
+            print("기존 데이터베이스 파일에 인덱스를 추가하고 사용합니다.")
+            return
+
+        # 손상된 파일이거나 저장된 버전이 다르면(모델/인덱스 구성 변경) 삭제하고 새로 만듦
+        remove_db_files()
+        print(f"기존 DB 파일 삭제 완료. (DB 버전 불일치: {db_version} != {DB_SCHEMA_VERSION})")
+
+    print("데이터베이스 파일을 새로 생성 및 초기화합니다.")
+    with app.app_context():
+        db.create_all()
+
+        # 파일 데이터 파싱/적재 중 오류가 나면 전체 트랜잭션을 되돌리고, 새로 만든 DB 파일도 지운 뒤 오류를 그대로 전달
+        # (일부만 적재된 DB에 버전이 기록되거나, 빈 테이블만 남은 파일이 다음 실행에서 기존 DB로 취급되지 않도록 함)
+        try:
+            # 초기 적재 동안에는 커밋 시 fsync를 생략 (실패해도 DB를 새로 만들면 되는 일회성 작업)
+            # 카테고리와 두 JSON 파일의 데이터는 아래에서 하나의 트랜잭션으로 묶어 마지막에 한 번만 커밋
+            db.session.execute(text('PRAGMA synchronous=OFF'))
 
             # 초기 카테고리 데이터 삽입
             categories_list = ['축제', '팝업 스토어', '할인 행사', '전시', '공연'] 
-            for name in categories_list:
-                if not Category.query.filter_by(category_name=name).first():
-                    cat = Category(category_name=name)
-                    db.session.add(cat)
-            
-            db.session.commit()
+            # 이미 있는 카테고리 이름만 한 번에 조회(ORM 객체 생성 없음)하고, 없는 것만 한 번에 INSERT
+            existing = set(db.session.scalars(db.select(Category.category_name)))
+            new_categories = [{'category_name': name} for name in categories_list if name not in existing]
+            if new_categories:
+                db.session.execute(Category.__table__.insert(), new_categories)
+        
+            clear_category_cache()
             print("초기 카테고리 데이터 삽입 완료.")
-            
-            category_map = {cat.category_name: cat.category_id for cat in Category.query.all()}
+        
+            category_map = get_category_map()
 
             # ------------------------------------------------------------
             # 1. '축제' 데이터 로딩
             # ------------------------------------------------------------
-            
-            # DB의 '축제' 카테고리 ID 가져오기
-            festival_cat_id = category_map.get('축제')
-            
+        
             # JSON 키 매핑 (기존 축제 데이터)
             festival_key_map = {
                 'title': '축제명',
@@ -149,19 +359,15 @@ def init_db():
                 'end_date': '축제종료일자',
                 'description': '축제내용'
             }
-            
-            festival_data = load_json_file('전국문화축제표준데이터.json')
-            if festival_data and festival_cat_id is not None:
-                count = load_data_into_db(festival_data, festival_cat_id, festival_key_map)
-                print(f"'{festival_key_map['title']}' 파일에서 이벤트 데이터 {count}개 삽입 완료. (카테고리: 축제)")
+        
+            festival_data = load_json_file('전국문화축제표준데이터.json')
+            count = load_data_into_db(festival_data, category_map, '축제', festival_key_map)
+            print(f"'{festival_key_map['title']}' 파일에서 이벤트 데이터 {count}개 삽입 완료. (카테고리: 축제)")
 
             # ------------------------------------------------------------
             # 2. '공연' 데이터 로딩
             # ------------------------------------------------------------
-            
-            # DB의 '공연' 카테고리 ID 가져오기
-            performance_cat_id = category_map.get('공연')
-            
+        
             # JSON 키 매핑 (새로운 공연 데이터)
             performance_key_map = {
                 'title': '행사명',
@@ -170,80 +376,158 @@ def init_db():
                 'end_date': '행사종료일자',
                 'description': '행사내용'
             }
-            
-            performance_data = load_json_file('전국공연행사정보표준데이터.json')
-            if performance_data and performance_cat_id is not None:
-                count = load_data_into_db(performance_data, performance_cat_id, performance_key_map)
-                print(f"'{performance_key_map['title']}' 파일에서 이벤트 데이터 {count}개 삽입 완료. (카테고리: 공연)")
-            
-    else:
-        print("기존 데이터베이스 파일을 사용합니다.")
+        
+            performance_data = load_json_file('전국공연행사정보표준데이터.json')
+            count = load_data_into_db(performance_data, category_map, '공연', performance_key_map)
+            print(f"'{performance_key_map['title']}' 파일에서 이벤트 데이터 {count}개 삽입 완료. (카테고리: 공연)")
+
+            db.session.commit()
+        except BaseException:
+            # Ctrl-C(KeyboardInterrupt) 등으로 중단된 경우에도 빈 테이블만 남은 파일이 남지 않도록 함
+            db.session.rollback()
+            remove_db_files()
+            print("초기 데이터 적재 중 오류가 발생하여 DB 파일을 삭제했습니다. 오류를 확인한 뒤 다시 실행하세요.")
+            raise
+        # synchronous=OFF가 적용된 연결을 닫아, 이후 연결은 connect 시 설정(NORMAL)을 다시 적용받도록 함
+        db.engine.dispose()
+
+    stamp_db_version()
 
 
 # --- 5. Flask 라우팅 (웹페이지 URL 처리) 설정 ---
+def parse_event_form(form):
+    """등록/수정 폼 데이터를 검증하여 Event 컬럼 dict로 변환"""
+    # 날짜/카테고리 형식 오류는 여기서 사용자용 메시지와 함께 400 Bad Request로 응답
+    # 필수 항목 누락(KeyError)은 Flask가 자동으로 400 Bad Request 처리
+    start_date = parse_iso_date(form['start_date'])
+    end_date = parse_iso_date(form['end_date'])
+    if start_date is None or end_date is None:
+        raise BadRequest("입력값 오류: 날짜는 YYYY-MM-DD 형식이어야 합니다.")
+    try:
+        category_id = int(form['category_id'])
+    except ValueError:
+        raise BadRequest("입력값 오류: 카테고리를 올바르게 선택해 주세요.")
+    return {
+        'title': form['title'],
+        'description': form.get('description', ''),
+        'location': form['location'],
+        'start_date': start_date,
+        'end_date': end_date,
+        'category_id': category_id,
+    }
+
+def optimize_db():
+    """이벤트 변경 후 PRAGMA optimize 실행 (통계가 오래된 테이블만 SQLite가 골라서 ANALYZE)"""
+    # 데이터가 늘어나도 쿼리 플래너가 인덱스를 올바르게 선택하도록 함, 변경이 적으면 거의 아무 작업도 하지 않음
+    # 통계 갱신은 부가 작업이므로 실패해도 이미 커밋된 요청은 정상 응답
+    try:
+        db.session.execute(text('PRAGMA optimize'))
+        db.session.commit()
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        app.logger.warning("PRAGMA optimize 실행 실패: %s", e)
+
 @app.route('/')
 def event_list():
-    categories = Category.query.all()
-    today = datetime.today().date()
-    
-    events = Event.query.filter(Event.end_date >= today).order_by(Event.start_date.asc()).all() 
-    
-    return render_template('index.html', events=events, categories=categories, today=today)
+    today = date.today()
+
+    cached = _event_list_cache.get(today)
+    if cached is None or cached[0] < time.monotonic():
+        # 조회 전에 세대 값을 기억해 두고, 렌더링 후에도 같을 때만 캐시에 저장
+        generation = _event_list_cache_generation
+        # 카테고리 이름은 캐시된 카테고리에서 찾으므로 category 테이블을 JOIN 하지 않음
+        # (필터용 카테고리 목록은 브라우저가 /api/categories에서 따로 받아 캐싱)
+        category_names = {cat.category_id: cat.category_name for cat in get_categories()}
+
+        events = db.session.execute(EVENT_LIST_QUERY, {'today': today}).all()
+
+        html = render_template('index.html', events=events,
+                               category_names=category_names, today=today)
+        cached = (time.monotonic() + EVENT_LIST_CACHE_TIMEOUT, html,
+                  hashlib.md5(html.encode('utf-8')).hexdigest())
+        with _event_list_cache_lock:
+            if generation == _event_list_cache_generation:
+                # 지난 날짜의 캐시는 더 이상 쓰이지 않으므로 비우고 오늘 것만 보관
+                _event_list_cache.clear()
+                _event_list_cache[today] = cached
+
+    # 브라우저가 같은 ETag를 보내면 본문 없이 304 Not Modified 응답
+    response = make_response(cached[1])
+    response.set_etag(cached[2])
+    return response.make_conditional(request)
+
+@app.route('/api/categories')
+def category_api():
+    # 카테고리는 거의 바뀌지 않으므로 브라우저/프록시가 1시간 동안 재사용하도록 허용
+    response = jsonify([
+        {'id': cat.category_id, 'name': cat.category_name} for cat in get_categories()
+    ])
+    response.headers['Cache-Control'] = 'public, max-age=3600'
+    return response
 
 @app.route('/new', methods=['GET', 'POST'])
 def event_create():
-    categories = Category.query.all()
+    categories = get_categories()
     if request.method == 'GET':
         return render_template('create.html', categories=categories)
     elif request.method == 'POST':
+        row = parse_event_form(request.form)
         try:
-            title = request.form['title']
-            description = request.form.get('description', '')
-            location = request.form['location']
-            start_date = datetime.strptime(request.form['start_date'], '%Y-%m-%d').date()
-            end_date = datetime.strptime(request.form['end_date'], '%Y-%m-%d').date()
-            category_id = int(request.form['category_id'])
-            new_event = Event(title=title, description=description, location=location, start_date=start_date, end_date=end_date, category_id=category_id)
-            db.session.add(new_event)
+            # ORM 객체를 만들지 않고 검증된 dict로 바로 INSERT
+            db.session.execute(db.insert(Event), [row])
             db.session.commit()
-            return redirect(url_for('event_list'))
-        except Exception as e:
+        except SQLAlchemyError as e:
             db.session.rollback()
             return f"이벤트 등록 오류 발생: {e}", 500
+        clear_event_list_cache()
+        optimize_db()
+        return redirect(url_for('event_list'))
 
 @app.route('/<int:event_id>', methods=['GET', 'POST'])
 def event_detail(event_id):
-    event = Event.query.get_or_404(event_id)
-    categories = Category.query.all()
+    event = db.get_or_404(Event, event_id)
+    categories = get_categories()
     if request.method == 'GET':
         return render_template('detail.html', event=event, categories=categories)
     elif request.method == 'POST':
+        row = parse_event_form(request.form)
         try:
-            event.title = request.form['title']
-            event.description = request.form.get('description', '')
-            event.location = request.form['location']
-            event.start_date = datetime.strptime(request.form['start_date'], '%Y-%m-%d').date()
-            event.end_date = datetime.strptime(request.form['end_date'], '%Y-%m-%d').date()
-            event.category_id = int(request.form['category_id'])
+            for column, value in row.items():
+                setattr(event, column, value)
             db.session.commit()
-            return redirect(url_for('event_detail', event_id=event.event_id))
-        except Exception as e:
+        except SQLAlchemyError as e:
             db.session.rollback()
             return f"이벤트 수정 오류 발생: {e}", 500
+        clear_event_list_cache()
+        optimize_db()
+        return redirect(url_for('event_detail', event_id=event_id))
 
 @app.route('/delete/<int:event_id>', methods=['POST'])
 def event_delete(event_id):
-    event = Event.query.get_or_404(event_id)
     try:
-        db.session.delete(event)
+        # 먼저 SELECT로 객체를 불러오지 않고 기본 키로 바로 DELETE (쿼리 한 번)
+        result = db.session.execute(db.delete(Event).where(Event.event_id == event_id))
+        if result.rowcount == 0:
+            db.session.rollback()
+            abort(404)
         db.session.commit()
-        return redirect(url_for('event_list'))
-    except Exception as e:
+    except SQLAlchemyError as e:
         db.session.rollback()
         return f"이벤트 삭제 오류 발생: {e}", 500
+    clear_event_list_cache()
+    optimize_db()
+    return redirect(url_for('event_list'))
+
+
+@app.cli.command('init-db')
+def init_db_command():
+    """DB 생성 및 공공데이터 JSON 초기 적재 (최초 1회 실행)"""
+    # 웹 서버(워커)가 시작될 때마다 DB 확인/적재를 반복하지 않도록 초기화는 CLI 명령으로 분리
+    init_db()
 
 
 if __name__ == '__main__':
-    with app.app_context():
-        init_db()
-    app.run(debug=True)
\ No newline at end of file
+    # 개발 서버는 FLASK_DEBUG=1 일 때만 debug 모드(리로더/디버거)로 실행
+    # 운영 환경에서는 이 블록 대신 gunicorn 같은 WSGI 서버로 app 객체를 실행 (README 참고)
+    # DB 초기화는 실행 전에 `flask --app app init-db`로 한 번 수행
+    app.run()
\ No newline at end of file